@@ -1,10 +1,8 @@
 """CLI for add-agent command."""
 
-from typing import Annotated
-
 import typer
 
-from agent_resources.cli.common import handle_add_resource
+from agent_resources.cli.common import build_add_command
 from agent_resources.fetcher import ResourceType
 
 app = typer.Typer(
@@ -12,44 +10,21 @@ app = typer.Typer(
     help="Add Claude Code sub-agents from GitHub to your project.",
 )
 
+ADD_HELP = """
+Add one or more sub-agents from GitHub repositories.
+
+Each agent will be copied to .claude/agents/<agent-name>.md in the
+current directory (or ~/.claude/agents/ with --global). Agents from the
+same repository are fetched with a single download.
+
+Example:
+    add-agent kasperjunge/code-reviewer
+    add-agent kasperjunge/my-repo/code-reviewer
+    add-agent kasperjunge/test-writer --global
+    add-agent kasperjunge/code-reviewer kasperjunge/test-writer
+"""
 
-@app.command()
-def add(
-    agent_ref: Annotated[
-        str,
-        typer.Argument(
-            help="Agent to add: <username>/<agent-name> or <username>/<repo>/<agent-name>",
-            metavar="USERNAME/[REPO/]AGENT-NAME",
-        ),
-    ],
-    overwrite: Annotated[
-        bool,
-        typer.Option(
-            "--overwrite",
-            help="Overwrite existing agent if it exists.",
-        ),
-    ] = False,
-    global_install: Annotated[
-        bool,
-        typer.Option(
-            "--global",
-            "-g",
-            help="Install to ~/.claude/ instead of ./.claude/",
-        ),
-    ] = False,
-) -> None:
-    """
-    Add a sub-agent from a GitHub repository.
-
-    The agent will be copied to .claude/agents/<agent-name>.md in the
-    current directory (or ~/.claude/agents/ with --global).
-
-    Example:
-        add-agent kasperjunge/code-reviewer
-        add-agent kasperjunge/my-repo/code-reviewer
-        add-agent kasperjunge/test-writer --global
-    """
-    handle_add_resource(agent_ref, ResourceType.AGENT, "agents", overwrite, global_install)
+add = app.command()(build_add_command(ResourceType.AGENT, "agents", ADD_HELP))
 
 
 if __name__ == "__main__":
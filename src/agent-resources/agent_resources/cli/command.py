@@ -1,10 +1,8 @@
 """CLI for add-command command."""
 
-from typing import Annotated
-
 import typer
 
-from agent_resources.cli.common import handle_add_resource
+from agent_resources.cli.common import build_add_command
 from agent_resources.fetcher import ResourceType
 
 app = typer.Typer(
@@ -12,44 +10,21 @@ app = typer.Typer(
     help="Add Claude Code slash commands from GitHub to your project.",
 )
 
+ADD_HELP = """
+Add one or more slash commands from GitHub repositories.
+
+Each command will be copied to .claude/commands/<command-name>.md in the
+current directory (or ~/.claude/commands/ with --global). Commands from
+the same repository are fetched with a single download.
+
+Example:
+    add-command kasperjunge/commit
+    add-command kasperjunge/my-repo/commit
+    add-command kasperjunge/review-pr --global
+    add-command kasperjunge/commit kasperjunge/review-pr
+"""
 
-@app.command()
-def add(
-    command_ref: Annotated[
-        str,
-        typer.Argument(
-            help="Command to add: <username>/<command-name> or <username>/<repo>/<command-name>",
-            metavar="USERNAME/[REPO/]COMMAND-NAME",
-        ),
-    ],
-    overwrite: Annotated[
-        bool,
-        typer.Option(
-            "--overwrite",
-            help="Overwrite existing command if it exists.",
-        ),
-    ] = False,
-    global_install: Annotated[
-        bool,
-        typer.Option(
-            "--global",
-            "-g",
-            help="Install to ~/.claude/ instead of ./.claude/",
-        ),
-    ] = False,
-) -> None:
-    """
-    Add a slash command from a GitHub repository.
-
-    The command will be copied to .claude/commands/<command-name>.md in the
-    current directory (or ~/.claude/commands/ with --global).
-
-    Example:
-        add-command kasperjunge/commit
-        add-command kasperjunge/my-repo/commit
-        add-command kasperjunge/review-pr --global
-    """
-    handle_add_resource(command_ref, ResourceType.COMMAND, "commands", overwrite, global_install)
+add = app.command()(build_add_command(ResourceType.COMMAND, "commands", ADD_HELP))
 
 
 if __name__ == "__main__":
@@ -1,21 +1,19 @@
 """Shared CLI utilities for add-skill, add-command, and add-agent."""
 
+import functools
 import random
+from collections.abc import Callable
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Annotated
 
 import typer
 from rich.console import Console
 from rich.live import Live
 from rich.spinner import Spinner
 
-from agent_resources.exceptions import (
-    ClaudeAddError,
-    RepoNotFoundError,
-    ResourceExistsError,
-    ResourceNotFoundError,
-)
-from agent_resources.fetcher import ResourceType, fetch_resource
+from agent_resources.exceptions import ClaudeAddError, InvalidResourceRefError
+from agent_resources.fetcher import ResourceType, ensure_not_installed, fetch_resources
 
 console = Console()
 
@@ -36,13 +34,13 @@ def parse_nested_name(name: str) -> tuple[str, list[str]]:
         - path_segments is the full list of segments (e.g., ["dir", "hello-world"])
 
     Raises:
-        typer.BadParameter: If the name has invalid colon usage
+        InvalidResourceRefError: If the name has invalid colon usage
     """
     if not name:
-        raise typer.BadParameter("Resource name cannot be empty")
+        raise InvalidResourceRefError("Resource name cannot be empty")
 
     if name.startswith(":") or name.endswith(":"):
-        raise typer.BadParameter(
+        raise InvalidResourceRefError(
             f"Invalid resource name '{name}': cannot start or end with ':'"
         )
 
@@ -50,7 +48,7 @@ def parse_nested_name(name: str) -> tuple[str, list[str]]:
 
     # Check for empty segments (consecutive colons)
     if any(not seg for seg in segments):
-        raise typer.BadParameter(
+        raise InvalidResourceRefError(
             f"Invalid resource name '{name}': contains empty path segments"
         )
 
@@ -78,29 +76,32 @@ def parse_resource_ref(ref: str) -> tuple[str, str, str, list[str]]:
         - path_segments: list of path components (for file operations)
 
     Raises:
-        typer.BadParameter: If the format is invalid
+        InvalidResourceRefError: If the format is invalid
     """
-    parts = ref.split("/")
+    username, repo, name, path_segments = _parse_resource_ref(ref)
+    # Copy so callers never mutate the cached segments
+    return username, repo, name, list(path_segments)
 
-    if len(parts) == 2:
-        username, name = parts
-        repo = DEFAULT_REPO_NAME
-    elif len(parts) == 3:
-        username, repo, name = parts
-    else:
-        raise typer.BadParameter(
-            f"Invalid format: '{ref}'. Expected: <username>/<name> or <username>/<repo>/<name>"
-        )
 
-    if not username or not name or (len(parts) == 3 and not repo):
-        raise typer.BadParameter(
+@functools.lru_cache(maxsize=256)
+def _parse_resource_ref(ref: str) -> tuple[str, str, str, tuple[str, ...]]:
+    """Memoized implementation of parse_resource_ref."""
+    username, sep, rest = ref.partition("/")
+    repo, sep_repo, name = rest.partition("/")
+
+    if not sep_repo:
+        # Only one slash: '<username>/<name>'
+        repo, name = DEFAULT_REPO_NAME, rest
+
+    if not sep or not username or not repo or not name or "/" in name:
+        raise InvalidResourceRefError(
             f"Invalid format: '{ref}'. Expected: <username>/<name> or <username>/<repo>/<name>"
         )
 
     # Parse nested path from name
     _base_name, path_segments = parse_nested_name(name)
 
-    return username, repo, name, path_segments
+    return username, repo, name, tuple(path_segments)
 
 
 def get_destination(resource_subdir: str, global_install: bool) -> Path:
@@ -129,10 +130,17 @@ def fetch_spinner():
         yield
 
 
-def print_success_message(resource_type: str, name: str, username: str, repo: str) -> None:
+def print_success_message(
+    resource_type: str, name: str, username: str, repo: str, show_cta: bool = True
+) -> None:
     """Print branded success message with rotating CTA."""
     console.print(f"✅ Added {resource_type} '{name}' via 🧩 agent-resources", style="dim")
+    if show_cta:
+        print_cta(resource_type, name, username, repo)
 
+
+def print_cta(resource_type: str, name: str, username: str, repo: str) -> None:
+    """Print a randomly chosen call to action."""
     # Build share reference based on whether custom repo was used
     if repo == DEFAULT_REPO_NAME:
         share_ref = f"{username}/{name}"
@@ -148,7 +156,7 @@ def print_success_message(resource_type: str, name: str, username: str, repo: st
 
 
 def handle_add_resource(
-    resource_ref: str,
+    resource_refs: list[str],
     resource_type: ResourceType,
     resource_subdir: str,
     overwrite: bool = False,
@@ -157,27 +165,108 @@ def handle_add_resource(
     """
     Generic handler for adding any resource type.
 
+    Resources from the same repository are fetched together, so each
+    repository tarball is downloaded only once. Every resource is checked
+    against local installs before anything is fetched. Repositories are
+    then installed one at a time, so a resource missing from a later
+    repository leaves those from earlier repositories installed.
+
     Args:
-        resource_ref: Resource reference (e.g., "username/resource-name")
+        resource_refs: Resource references (e.g., ["username/resource-name"])
         resource_type: Type of resource (SKILL, COMMAND, or AGENT)
         resource_subdir: Destination subdirectory (e.g., "skills", "commands", "agents")
-        overwrite: Whether to overwrite existing resource
+        overwrite: Whether to overwrite existing resources
         global_install: If True, install to ~/.claude/, else to ./.claude/
     """
     try:
-        username, repo_name, name, path_segments = parse_resource_ref(resource_ref)
-    except typer.BadParameter as e:
-        typer.echo(f"Error: {e}", err=True)
-        raise typer.Exit(1)
-
-    dest = get_destination(resource_subdir, global_install)
+        by_repo: dict[tuple[str, str], list[tuple[str, list[str]]]] = {}
+        # Install path (as segments) -> repository it is requested from
+        requested: dict[tuple[str, ...], tuple[str, str]] = {}
+        for resource_ref in resource_refs:
+            username, repo_name, name, path_segments = parse_resource_ref(resource_ref)
+            key = tuple(path_segments)
+            if key in requested:
+                if requested[key] == (username, repo_name):
+                    # Same resource spelled differently, e.g. 'u/x' and 'u/agent-resources/x'
+                    continue
+                raise ClaudeAddError(
+                    f"{resource_type.value.capitalize()} '{name}' is requested from both "
+                    f"{'/'.join(requested[key])} and {username}/{repo_name}."
+                )
+            requested[key] = (username, repo_name)
+            by_repo.setdefault((username, repo_name), []).append((name, path_segments))
+
+        dest = get_destination(resource_subdir, global_install)
+
+        # Check every repository's resources before fetching any of them
+        if not overwrite:
+            ensure_not_installed(
+                [resource for resources in by_repo.values() for resource in resources],
+                dest,
+                resource_type,
+            )
 
-    try:
+        # (name, username, repo_name) of the last resource added, for the CTA
+        last_added: tuple[str, str, str] | None = None
         with fetch_spinner():
-            fetch_resource(
-                username, repo_name, name, path_segments, dest, resource_type, overwrite
-            )
-        print_success_message(resource_type.value, name, username, repo_name)
-    except (RepoNotFoundError, ResourceNotFoundError, ResourceExistsError, ClaudeAddError) as e:
+            for (username, repo_name), resources in by_repo.items():
+                fetch_resources(
+                    username, repo_name, resources, dest, resource_type, overwrite
+                )
+                for name, _path_segments in resources:
+                    print_success_message(
+                        resource_type.value, name, username, repo_name, show_cta=False
+                    )
+                    last_added = (name, username, repo_name)
+        if last_added is not None:
+            print_cta(resource_type.value, *last_added)
+    except ClaudeAddError as e:
+        # Covers invalid refs as well as every fetch error
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
+
+
+def build_add_command(
+    resource_type: ResourceType, resource_subdir: str, help_text: str
+) -> Callable[..., None]:
+    """
+    Build the Typer command function for add-skill, add-command, or add-agent.
+
+    Args:
+        resource_type: Type of resource (SKILL, COMMAND, or AGENT)
+        resource_subdir: Destination subdirectory (e.g., "skills", "commands", "agents")
+        help_text: Docstring for the command, shown by --help
+
+    Returns:
+        Command function to register with app.command()
+    """
+    noun = resource_type.value
+
+    def add(
+        resource_refs: Annotated[
+            list[str],
+            typer.Argument(
+                help=f"{resource_subdir.capitalize()} to add: <username>/<{noun}-name> or <username>/<repo>/<{noun}-name>",
+                metavar=f"USERNAME/[REPO/]{noun.upper()}-NAME...",
+            ),
+        ],
+        overwrite: Annotated[
+            bool,
+            typer.Option(
+                "--overwrite",
+                help=f"Overwrite existing {noun} if it exists.",
+            ),
+        ] = False,
+        global_install: Annotated[
+            bool,
+            typer.Option(
+                "--global",
+                "-g",
+                help="Install to ~/.claude/ instead of ./.claude/",
+            ),
+        ] = False,
+    ) -> None:
+        handle_add_resource(resource_refs, resource_type, resource_subdir, overwrite, global_install)
+
+    add.__doc__ = help_text
+    return add
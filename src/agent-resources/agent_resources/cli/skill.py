@@ -1,10 +1,8 @@
 """CLI for add-skill command."""
 
-from typing import Annotated
-
 import typer
 
-from agent_resources.cli.common import handle_add_resource
+from agent_resources.cli.common import build_add_command
 from agent_resources.fetcher import ResourceType
 
 app = typer.Typer(
@@ -12,44 +10,21 @@ app = typer.Typer(
     help="Add Claude Code skills from GitHub to your project.",
 )
 
+ADD_HELP = """
+Add one or more skills from GitHub repositories.
+
+Each skill will be copied to .claude/skills/<skill-name>/ in the current
+directory (or ~/.claude/skills/ with --global). Skills from the same
+repository are fetched with a single download.
+
+Example:
+    add-skill kasperjunge/analyze-paper
+    add-skill kasperjunge/my-repo/analyze-paper
+    add-skill kasperjunge/analyze-paper --global
+    add-skill kasperjunge/analyze-paper kasperjunge/summarize
+"""
 
-@app.command()
-def add(
-    skill_ref: Annotated[
-        str,
-        typer.Argument(
-            help="Skill to add: <username>/<skill-name> or <username>/<repo>/<skill-name>",
-            metavar="USERNAME/[REPO/]SKILL-NAME",
-        ),
-    ],
-    overwrite: Annotated[
-        bool,
-        typer.Option(
-            "--overwrite",
-            help="Overwrite existing skill if it exists.",
-        ),
-    ] = False,
-    global_install: Annotated[
-        bool,
-        typer.Option(
-            "--global",
-            "-g",
-            help="Install to ~/.claude/ instead of ./.claude/",
-        ),
-    ] = False,
-) -> None:
-    """
-    Add a skill from a GitHub repository.
-
-    The skill will be copied to .claude/skills/<skill-name>/ in the current
-    directory (or ~/.claude/skills/ with --global).
-
-    Example:
-        add-skill kasperjunge/analyze-paper
-        add-skill kasperjunge/my-repo/analyze-paper
-        add-skill kasperjunge/analyze-paper --global
-    """
-    handle_add_resource(skill_ref, ResourceType.SKILL, "skills", overwrite, global_install)
+add = app.command()(build_add_command(ResourceType.SKILL, "skills", ADD_HELP))
 
 
 if __name__ == "__main__":
@@ -23,3 +23,9 @@ class ResourceExistsError(ClaudeAddError):
     """Raised when the resource already exists locally."""
 
     pass
+
+
+class InvalidResourceRefError(ClaudeAddError, ValueError):
+    """Raised when a resource reference or name is malformed."""
+
+    pass
@@ -1,11 +1,20 @@
 """Generic resource fetcher for skills, commands, and agents."""
 
+import atexit
+import os
+import posixpath
 import shutil
 import tarfile
 import tempfile
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import IO
+from urllib.parse import quote
 
 import httpx
 
@@ -61,6 +70,48 @@ RESOURCE_CONFIGS: dict[ResourceType, ResourceConfig] = {
 }
 
 
+@dataclass
+class _PlannedResource:
+    """A resource queued for installation by fetch_resources."""
+
+    name: str  # display name, e.g. "dir:hello-world"
+    path_segments: list[str]
+    dest: Path  # where it will be installed
+    source_path: str  # POSIX path within the repo, e.g. ".claude/skills/dir/hello-world"
+
+
+# Upper bound on concurrent single-file downloads
+MAX_PARALLEL_FETCHES = 8
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps the connection pool (and its TLS sessions)
+    alive across fetches within the same process. The client is safe to
+    share between threads, and HTTP/2 lets concurrent fetches to the same
+    host multiplex over one connection.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=MAX_PARALLEL_FETCHES,
+                    max_keepalive_connections=MAX_PARALLEL_FETCHES,
+                    keepalive_expiry=60.0,
+                ),
+            )
+            atexit.register(_client.close)
+    return _client
+
+
 def _build_resource_path(base_dir: Path, config: ResourceConfig, path_segments: list[str]) -> Path:
     """Build a resource path from base directory and segments."""
     if config.is_directory:
@@ -71,106 +122,431 @@ def _build_resource_path(base_dir: Path, config: ResourceConfig, path_segments:
     return base_dir / f"{base_name}{config.file_extension}"
 
 
-def _download_and_extract_tarball(tarball_url: str, username: str, repo_name: str, tmp_path: Path) -> Path:
-    """Download and extract a GitHub tarball, returning the repo directory path."""
-    tarball_path = tmp_path / "repo.tar.gz"
+def _cache_dir() -> Path:
+    """Return the directory where downloaded repository tarballs are cached."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "agent-resources"
 
+
+@contextmanager
+def _tarball_response(
+    tarball_url: str, username: str, repo_name: str, headers: dict[str, str] | None = None
+) -> Iterator[httpx.Response]:
+    """Stream a GitHub tarball request, turning HTTP failures into package errors."""
     try:
-        with httpx.Client(follow_redirects=True, timeout=30.0) as client:
-            response = client.get(tarball_url)
+        with _get_client().stream("GET", tarball_url, headers=headers) as response:
             if response.status_code == 404:
                 raise RepoNotFoundError(
                     f"Repository '{username}/{repo_name}' not found on GitHub."
                 )
-            response.raise_for_status()
-            tarball_path.write_bytes(response.content)
+            if response.status_code != 304:
+                response.raise_for_status()
+            yield response
     except httpx.HTTPStatusError as e:
         raise ClaudeAddError(f"Failed to download repository: {e}")
     except httpx.RequestError as e:
         raise ClaudeAddError(f"Network error: {e}")
 
-    extract_path = tmp_path / "extracted"
-    with tarfile.open(tarball_path, "r:gz") as tar:
-        tar.extractall(extract_path)
 
-    return extract_path / f"{repo_name}-main"
+def _write_body(response: httpx.Response, f: IO[bytes]) -> None:
+    """Stream a response body to f so memory stays bounded by the chunk size."""
+    for chunk in response.iter_bytes(chunk_size=64 * 1024):
+        f.write(chunk)
 
 
-def fetch_resource(
+def _cached_tarball_paths(username: str, repo_name: str) -> tuple[Path, Path]:
+    """Return the (tarball, ETag) cache paths for a repository."""
+    cache_dir = _cache_dir()
+    return (
+        cache_dir / f"{username}_{repo_name}.tar.gz",
+        cache_dir / f"{username}_{repo_name}.etag",
+    )
+
+
+def _clear_cached_tarball(username: str, repo_name: str) -> None:
+    """Remove a repository's cached tarball and ETag, if present."""
+    for path in _cached_tarball_paths(username, repo_name):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _download_cached_tarball(tarball_url: str, username: str, repo_name: str) -> Path:
+    """Download a GitHub tarball into the cache, returning its path.
+
+    A previously cached tarball is revalidated with its ETag and reused
+    as-is when GitHub answers 304 Not Modified.
+    """
+    tarball_path, etag_path = _cached_tarball_paths(username, repo_name)
+    tarball_path.parent.mkdir(parents=True, exist_ok=True)
+
+    headers = {}
+    if tarball_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    with _tarball_response(tarball_url, username, repo_name, headers) as response:
+        if response.status_code == 304:
+            return tarball_path
+        # A unique partial file keeps concurrent runs from writing into each other
+        part = tempfile.NamedTemporaryFile(
+            dir=tarball_path.parent, prefix=f"{tarball_path.name}.", suffix=".part", delete=False
+        )
+        part_path = Path(part.name)
+        try:
+            with part:
+                _write_body(response, part)
+            # Drop the old ETag first so it can never pair with a newer tarball
+            etag_path.unlink(missing_ok=True)
+            part_path.replace(tarball_path)
+        finally:
+            part_path.unlink(missing_ok=True)
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_path.write_text(etag)
+
+    return tarball_path
+
+
+def _download_tarball(tarball_url: str, username: str, repo_name: str, tmp_path: Path) -> Path:
+    """Download a GitHub tarball, returning its path.
+
+    The cache is used when possible. If the cache directory cannot be
+    used, the tarball is downloaded into tmp_path without caching.
+    """
+    try:
+        return _download_cached_tarball(tarball_url, username, repo_name)
+    except OSError:
+        pass
+
+    tarball_path = tmp_path / "repo.tar.gz"
+    with _tarball_response(tarball_url, username, repo_name) as response:
+        with tarball_path.open("wb") as f:
+            _write_body(response, f)
+    return tarball_path
+
+
+def _fetch_raw_file(username: str, repo_name: str, source_path: str) -> bytes | None:
+    """Fetch a single file from the repo's main branch without the tarball.
+
+    Returns None when the file cannot be fetched this way, including when
+    it is a symlink, so the caller can fall back to the tarball (which also
+    yields precise errors and resolves links).
+
+    raw.githubusercontent.com is CDN-cached for about five minutes, so a
+    file fetched here can briefly lag behind the tarball used for skills.
+    """
+    # Quote the path so characters like '#', '?' or '%' cannot change the file requested
+    raw_url = (
+        f"https://raw.githubusercontent.com/{username}/{repo_name}/main/{quote(source_path)}"
+    )
+    try:
+        response = _get_client().get(raw_url)
+    except httpx.RequestError:
+        return None
+    if response.status_code != 200:
+        return None
+    content = response.content
+    if _looks_like_link_target(content):
+        return None
+    return content
+
+
+def _looks_like_link_target(content: bytes) -> bool:
+    """Whether a raw file body is a symlink's target path rather than real content.
+
+    raw.githubusercontent.com serves a symlinked blob as the bare path it
+    points to. Markdown resources always contain whitespace, so a short
+    body without any is treated as a link and left to the tarball.
+    """
+    return len(content) < 1024 and not any(c in content for c in b" \t\r\n")
+
+
+def _find_target(member_name: str, targets: set[str]) -> str | None:
+    """Return the target that member_name is, or lies under, if any."""
+    path = member_name
+    while path:
+        if path in targets:
+            return path
+        path = path.rpartition("/")[0]
+    return None
+
+
+def _link_escapes_targets(member: tarfile.TarInfo, targets: set[str]) -> bool:
+    """Whether a link member means the targets cannot be extracted on their own.
+
+    That is the case when the link replaces a target or one of its parent
+    directories, or when it lies inside a target but points outside it.
+    """
+    if not (member.issym() or member.islnk()):
+        return False
+    if any(target == member.name or target.startswith(member.name + "/") for target in targets):
+        return True
+    target = _find_target(member.name, targets)
+    if target is None:
+        return False
+    if member.issym():
+        link_path = posixpath.normpath(
+            posixpath.join(posixpath.dirname(member.name), member.linkname)
+        )
+    else:
+        # Hard link names are relative to the archive root
+        link_path = member.linkname
+    return _find_target(link_path, {target}) is None
+
+
+def _extract_targets(tarball_path: Path, targets: set[str], extract_path: Path) -> None:
+    """Extract only the given archive paths (files or directories) in a single pass.
+
+    Falls back to extracting the whole archive when links reach outside the
+    requested paths, since the copy into place follows them.
+    """
+    # A target nested inside another requested target is extracted with it;
+    # tracking both would end the outer one as soon as the scan enters the inner
+    wanted = {
+        target for target in targets
+        if _find_target(target.rpartition("/")[0], targets) is None
+    }
+    outstanding = set(wanted)
+    current: str | None = None
+    needs_full_extraction = False
+
+    # Pipe mode reads the archive once, front to back, in 64 KiB blocks
+    with tarfile.open(tarball_path, "r|gz", bufsize=64 * 1024) as tar:
+        for member in tar:
+            if _link_escapes_targets(member, wanted):
+                needs_full_extraction = True
+                break
+            target = _find_target(member.name, outstanding)
+            if current is not None and target != current:
+                # GitHub archives list each directory's entries contiguously,
+                # so leaving a target means it has been fully extracted
+                outstanding.discard(current)
+                current = None
+                if not outstanding:
+                    break
+            if target is None:
+                continue
+            tar.extract(member, extract_path)
+            current = target
+
+    if needs_full_extraction:
+        shutil.rmtree(extract_path, ignore_errors=True)
+        with tarfile.open(tarball_path, "r|gz", bufsize=64 * 1024) as tar:
+            tar.extractall(extract_path)
+
+
+def ensure_not_installed(
+    resources: list[tuple[str, list[str]]],
+    dest: Path,
+    resource_type: ResourceType,
+) -> None:
+    """
+    Check that none of the resources is already installed in dest.
+
+    Args:
+        resources: (name, path_segments) pairs, as accepted by fetch_resource
+        dest: Destination directory (e.g., .claude/skills/, .claude/commands/)
+        resource_type: Type of resource (SKILL, COMMAND, or AGENT)
+
+    Raises:
+        ResourceExistsError: If a resource already exists locally
+    """
+    config = RESOURCE_CONFIGS[resource_type]
+    for name, path_segments in resources:
+        resource_dest = _build_resource_path(dest, config, path_segments)
+        if resource_dest.exists():
+            raise ResourceExistsError(
+                f"{resource_type.value.capitalize()} '{name}' already exists at {resource_dest}\n"
+                f"Use --overwrite to replace it."
+            )
+
+
+def fetch_resources(
     username: str,
     repo_name: str,
-    name: str,
-    path_segments: list[str],
+    resources: list[tuple[str, list[str]]],
     dest: Path,
     resource_type: ResourceType,
     overwrite: bool = False,
-) -> Path:
+) -> list[Path]:
     """
-    Fetch a resource from a user's GitHub repo and copy it to dest.
+    Fetch several resources from one GitHub repo with a single download.
+
+    Single-file resources (commands, agents) are fetched directly from
+    raw.githubusercontent.com. Otherwise the repository tarball is
+    downloaded once and only the requested resources are extracted from
+    it. Nothing is installed unless every resource is found.
 
     Args:
         username: GitHub username
         repo_name: GitHub repository name
-        name: Display name of the resource (may contain colons for nested paths)
-        path_segments: Path segments for the resource (e.g., ['dir', 'hello-world'])
+        resources: (name, path_segments) pairs, as accepted by fetch_resource
         dest: Destination directory (e.g., .claude/skills/, .claude/commands/)
         resource_type: Type of resource (SKILL, COMMAND, or AGENT)
-        overwrite: Whether to overwrite existing resource
+        overwrite: Whether to overwrite existing resources
 
     Returns:
-        Path to the installed resource
+        Paths to the installed resources, in the order given
 
     Raises:
         RepoNotFoundError: If the repository doesn't exist
-        ResourceNotFoundError: If the resource doesn't exist in the repo
-        ResourceExistsError: If resource exists locally and overwrite=False
+        ResourceNotFoundError: If a resource doesn't exist in the repo
+        ResourceExistsError: If a resource exists locally and overwrite=False
     """
+    if not resources:
+        return []
+
     config = RESOURCE_CONFIGS[resource_type]
-    resource_dest = _build_resource_path(dest, config, path_segments)
+    source_base = Path(config.source_subdir)
+
+    # Drop duplicate requests for the same resource, keeping the first
+    unique: dict[tuple[str, ...], str] = {}
+    for name, path_segments in resources:
+        unique.setdefault(tuple(path_segments), name)
+
+    # Check if any resource already exists locally
+    if not overwrite:
+        ensure_not_installed(
+            [(name, list(path_segments)) for path_segments, name in unique.items()],
+            dest,
+            resource_type,
+        )
 
-    # Check if resource already exists locally
-    if resource_dest.exists() and not overwrite:
-        raise ResourceExistsError(
-            f"{resource_type.value.capitalize()} '{name}' already exists at {resource_dest}\n"
-            f"Use --overwrite to replace it."
+    planned: list[_PlannedResource] = []
+    for path_segments_key, name in unique.items():
+        path_segments = list(path_segments_key)
+        resource_dest = _build_resource_path(dest, config, path_segments)
+        planned.append(
+            _PlannedResource(
+                name=name,
+                path_segments=path_segments,
+                dest=resource_dest,
+                source_path=_build_resource_path(source_base, config, path_segments).as_posix(),
+            )
         )
 
+    # Single-file resources are fetched directly; the tarball is only
+    # downloaded for directories and for files the fast path missed
+    raw_contents: dict[str, bytes] = {}
+    if not config.is_directory:
+        source_paths = [item.source_path for item in planned]
+        # Fetch concurrently so N files cost about one round trip, not N
+        with ThreadPoolExecutor(max_workers=min(len(source_paths), MAX_PARALLEL_FETCHES)) as pool:
+            contents = pool.map(
+                lambda source_path: _fetch_raw_file(username, repo_name, source_path),
+                source_paths,
+            )
+        raw_contents = {
+            source_path: content
+            for source_path, content in zip(source_paths, contents)
+            if content is not None
+        }
+
     # Download tarball
     tarball_url = (
         f"https://github.com/{username}/{repo_name}/archive/refs/heads/main.tar.gz"
     )
 
     with tempfile.TemporaryDirectory() as tmp_dir:
-        repo_dir = _download_and_extract_tarball(tarball_url, username, repo_name, Path(tmp_dir))
-        source_base = repo_dir / config.source_subdir
-        resource_source = _build_resource_path(source_base, config, path_segments)
-
-        if not resource_source.exists():
-            # Build display path for error message
-            nested_path = "/".join(path_segments)
-            if config.is_directory:
-                expected_location = f"{config.source_subdir}/{nested_path}/"
-            else:
-                expected_location = f"{config.source_subdir}/{nested_path}{config.file_extension}"
-            raise ResourceNotFoundError(
-                f"{resource_type.value.capitalize()} '{name}' not found in {username}/{repo_name}.\n"
-                f"Expected location: {expected_location}"
-            )
+        extract_path = Path(tmp_dir) / "extracted"
+        repo_dir = extract_path / f"{repo_name}-main"
+        remaining = [item for item in planned if item.source_path not in raw_contents]
+        if remaining:
+            targets = {f"{repo_name}-main/{item.source_path}" for item in remaining}
+            tarball_path = _download_tarball(tarball_url, username, repo_name, Path(tmp_dir))
+            try:
+                _extract_targets(tarball_path, targets, extract_path)
+            except (tarfile.TarError, EOFError, OSError):
+                # A corrupt cached tarball would be revalidated (304) forever,
+                # so drop it and download a fresh copy once. OSError covers a
+                # concurrent run replacing the cache file after our 304.
+                _clear_cached_tarball(username, repo_name)
+                shutil.rmtree(extract_path, ignore_errors=True)
+                tarball_path = _download_tarball(tarball_url, username, repo_name, Path(tmp_dir))
+                try:
+                    _extract_targets(tarball_path, targets, extract_path)
+                except (tarfile.TarError, EOFError, OSError) as e:
+                    _clear_cached_tarball(username, repo_name)
+                    raise ClaudeAddError(f"Failed to read repository archive: {e}")
 
-        # Remove existing if overwriting
-        if resource_dest.exists():
-            if config.is_directory:
-                shutil.rmtree(resource_dest)
-            else:
-                resource_dest.unlink()
+        for item in remaining:
+            if not (repo_dir / item.source_path).exists():
+                # Build display path for error message
+                nested_path = "/".join(item.path_segments)
+                if config.is_directory:
+                    expected_location = f"{config.source_subdir}/{nested_path}/"
+                else:
+                    expected_location = f"{config.source_subdir}/{nested_path}{config.file_extension}"
+                raise ResourceNotFoundError(
+                    f"{resource_type.value.capitalize()} '{item.name}' not found in {username}/{repo_name}.\n"
+                    f"Expected location: {expected_location}"
+                )
+
+        for item in planned:
+            resource_source = repo_dir / item.source_path
+
+            # Remove existing if overwriting
+            if item.dest.exists():
+                if config.is_directory:
+                    shutil.rmtree(item.dest)
+                else:
+                    item.dest.unlink()
 
-        # Ensure destination parent exists (including nested directories)
-        resource_dest.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure destination parent exists (including nested directories)
+            item.dest.parent.mkdir(parents=True, exist_ok=True)
 
-        # Copy resource to destination
-        if config.is_directory:
-            shutil.copytree(resource_source, resource_dest)
-        else:
-            shutil.copy2(resource_source, resource_dest)
+            # Copy resource to destination
+            try:
+                if item.source_path in raw_contents:
+                    item.dest.write_bytes(raw_contents[item.source_path])
+                elif config.is_directory:
+                    shutil.copytree(resource_source, item.dest)
+                else:
+                    shutil.copy2(resource_source, item.dest)
+            except OSError as e:
+                # Also covers shutil.Error, e.g. for dangling links inside a skill;
+                # don't leave a half-copied resource behind
+                if config.is_directory:
+                    shutil.rmtree(item.dest, ignore_errors=True)
+                else:
+                    item.dest.unlink(missing_ok=True)
+                raise ClaudeAddError(
+                    f"Failed to install {resource_type.value} '{item.name}': {e}"
+                )
+
+    return [item.dest for item in planned]
+
+
+def fetch_resource(
+    username: str,
+    repo_name: str,
+    name: str,
+    path_segments: list[str],
+    dest: Path,
+    resource_type: ResourceType,
+    overwrite: bool = False,
+) -> Path:
+    """
+    Fetch a resource from a user's GitHub repo and copy it to dest.
+
+    Args:
+        username: GitHub username
+        repo_name: GitHub repository name
+        name: Display name of the resource (may contain colons for nested paths)
+        path_segments: Path segments for the resource (e.g., ['dir', 'hello-world'])
+        dest: Destination directory (e.g., .claude/skills/, .claude/commands/)
+        resource_type: Type of resource (SKILL, COMMAND, or AGENT)
+        overwrite: Whether to overwrite existing resource
 
-    return resource_dest
+    Returns:
+        Path to the installed resource
+
+    Raises:
+        RepoNotFoundError: If the repository doesn't exist
+        ResourceNotFoundError: If the resource doesn't exist in the repo
+        ResourceExistsError: If resource exists locally and overwrite=False
+    """
+    return fetch_resources(
+        username, repo_name, [(name, path_segments)], dest, resource_type, overwrite
+    )[0]